@@ -15,12 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import copy
 import json
-import math
 import re
-from typing import Literal, Type
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, Type
 
-from pyld import jsonld
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO, HASH_ZERO
 from web3.exceptions import ContractLogicError
@@ -50,14 +52,14 @@ from dkg.exceptions import (
 from dkg.manager import DefaultRequestManager
 from dkg.method import Method
 from dkg.module import Module
-from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, Wei
+from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, NQuads, Wei
 from dkg.utils.blockchain_request import BlockchainRequest
-from dkg.utils.decorators import retry
+from dkg.utils.decorators import poll
 from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
 from dkg.utils.metadata import (
     generate_agreement_id,
-    generate_assertion_metadata,
     generate_keyword,
+    hash_and_measure_assertion,
 )
 from dkg.utils.node_request import (
     NodeRequest,
@@ -66,12 +68,22 @@ from dkg.utils.node_request import (
     validate_operation_status,
 )
 from dkg.utils.rdf import format_content, normalize_dataset
+from dkg.utils.rdf_native import from_rdf_nquads
 from dkg.utils.ual import format_ual, parse_ual
 
 
 class KnowledgeAsset(Module):
+    BLOCK_TIMESTAMP_CACHE_TTL = 1
+    OPERATION_RESULT_LONG_POLL_WAIT_MS = 30_000
+    OPERATION_RESULT_DEADLINE = 60
+    GET_RESULT_CACHE_MAX_ENTRIES = 256
+
     def __init__(self, manager: DefaultRequestManager):
         self.manager = manager
+        self._agreement_id_cache: dict[tuple[Address, int], bytes] = {}
+        self._agreement_data_cache: dict[bytes, tuple[AgreementData, float]] = {}
+        self._block_timestamp_cache: tuple[int, float] | None = None
+        self._get_result_cache: OrderedDict[tuple, dict] = OrderedDict()
 
     _owner = Method(BlockchainRequest.owner_of)
 
@@ -138,12 +150,13 @@ class KnowledgeAsset(Module):
         except Exception as err:
             raise ValueError(f"Error fetching asset owner: {err}")
 
-    _get_contract_address = Method(BlockchainRequest.get_contract_address)
     _get_current_allowance = Method(BlockchainRequest.allowance)
 
     def get_current_allowance(self, spender: Address | None = None) -> Wei:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = self.manager.blockchain_provider.get_contract_address(
+                "ServiceAgreementV1"
+            )
 
         return int(
             self._get_current_allowance(
@@ -156,7 +169,9 @@ class KnowledgeAsset(Module):
 
     def set_allowance(self, token_amount: Wei, spender: Address | None = None) -> Wei:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = self.manager.blockchain_provider.get_contract_address(
+                "ServiceAgreementV1"
+            )
 
         current_allowance = self.get_current_allowance(spender)
 
@@ -173,7 +188,9 @@ class KnowledgeAsset(Module):
         self, token_amount: Wei, spender: Address | None = None
     ) -> Wei:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = self.manager.blockchain_provider.get_contract_address(
+                "ServiceAgreementV1"
+            )
 
         self._increase_allowance(spender, token_amount)
 
@@ -183,7 +200,9 @@ class KnowledgeAsset(Module):
         self, token_amount: Wei, spender: Address | None = None
     ) -> Wei:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = self.manager.blockchain_provider.get_contract_address(
+                "ServiceAgreementV1"
+            )
 
         current_allowance = self.get_current_allowance(spender)
         subtracted_value = min(token_amount, current_allowance)
@@ -194,7 +213,6 @@ class KnowledgeAsset(Module):
 
     _chain_id = Method(BlockchainRequest.chain_id)
 
-    _get_asset_storage_address = Method(BlockchainRequest.get_asset_storage_address)
     _create = Method(BlockchainRequest.create_asset)
     _mint_paranet_knowledge_asset = Method(BlockchainRequest.mint_knowledge_asset)
 
@@ -202,6 +220,40 @@ class KnowledgeAsset(Module):
     _local_store = Method(NodeRequest.local_store)
     _publish = Method(NodeRequest.publish)
 
+    @staticmethod
+    def _build_assertions_list(
+        blockchain_id: str,
+        content_asset_storage_address: Address,
+        token_id: int,
+        public_assertion_id: str,
+        assertions: dict[str, NQuads],
+        store_type: StoreTypes,
+    ) -> list[dict[str, Any]]:
+        entries = [(public_assertion_id, assertions["public"])]
+
+        if assertions.get("private"):
+            entries.append(
+                (
+                    MerkleTree(
+                        hash_assertion_with_indexes(assertions["private"]),
+                        sort_pairs=True,
+                    ).root,
+                    assertions["private"],
+                )
+            )
+
+        return [
+            {
+                "blockchain": blockchain_id,
+                "contract": content_asset_storage_address,
+                "tokenId": token_id,
+                "assertionId": assertion_id,
+                "assertion": assertion,
+                "storeType": store_type,
+            }
+            for assertion_id, assertion in entries
+        ]
+
     def create(
         self,
         content: dict[Literal["public", "private"], JSONLD],
@@ -214,15 +266,17 @@ class KnowledgeAsset(Module):
         blockchain_id = self.manager.blockchain_provider.blockchain_id
         assertions = format_content(content, content_type)
 
+        public_assertion_leaves, public_assertion_metadata = (
+            hash_and_measure_assertion(assertions["public"])
+        )
         public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
+            public_assertion_leaves,
             sort_pairs=True,
         ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
 
-        content_asset_storage_address = self._get_asset_storage_address(
+        content_asset_storage_address = self.manager.blockchain_provider.contracts[
             "ContentAssetStorage"
-        )
+        ].address
 
         if token_amount is None:
             token_amount = int(
@@ -237,28 +291,50 @@ class KnowledgeAsset(Module):
                 )["bidSuggestion"]
             )
 
+        blockchain_provider = self.manager.blockchain_provider
+
+        allowance_tx_hash = None
         current_allowance = self.get_current_allowance()
         if is_allowance_increased := current_allowance < token_amount:
-            self.increase_allowance(token_amount)
+            if blockchain_provider.pipeline_transactions:
+                # Submit the allowance increase without waiting for its
+                # receipt; the signing middleware draws nonces from the
+                # pending count, so the mint below queues right behind it.
+                allowance_tx_hash = blockchain_provider.call_function(
+                    "Token",
+                    "increaseAllowance",
+                    args={
+                        "spender": blockchain_provider.get_contract_address(
+                            "ServiceAgreementV1"
+                        ),
+                        "addedValue": token_amount,
+                    },
+                    state_changing=True,
+                    wait_for_receipt=False,
+                )
+            else:
+                self.increase_allowance(token_amount)
 
         result = {"publicAssertionId": public_assertion_id, "operation": {}}
 
+        # Convert the assertion id to bytes once; both minting paths (and
+        # nothing else) need the bytes32 form.
+        knowledge_asset_args = {
+            "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
+            "size": public_assertion_metadata["size"],
+            "triplesNumber": public_assertion_metadata["triples_number"],
+            "chunksNumber": public_assertion_metadata["chunks_number"],
+            "tokenAmount": token_amount,
+            "epochsNumber": epochs_number,
+            "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
+                self.manager.blockchain_provider.environment
+            ][blockchain_id],
+            "immutable_": immutable,
+        }
+
         try:
             if paranet_ual is None:
-                receipt: TxReceipt = self._create(
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    }
-                )
+                receipt: TxReceipt = self._create(knowledge_asset_args)
             else:
                 parsed_paranet_ual = parse_ual(paranet_ual)
                 paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
@@ -269,18 +345,7 @@ class KnowledgeAsset(Module):
                 receipt: TxReceipt = self._mint_paranet_knowledge_asset(
                     paranet_knowledge_asset_storage,
                     paranet_knowledge_asset_token_id,
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    },
+                    knowledge_asset_args,
                 )
 
                 result["paranetId"] = Web3.to_hex(
@@ -294,6 +359,13 @@ class KnowledgeAsset(Module):
                 )
         except ContractLogicError as err:
             if is_allowance_increased:
+                if allowance_tx_hash is not None:
+                    # The pipelined increase may not have mined yet; wait for
+                    # it so the compensating decrease isn't computed against
+                    # the pre-increase allowance.
+                    blockchain_provider.w3.eth.wait_for_transaction_receipt(
+                        allowance_tx_hash
+                    )
                 self.decrease_allowance(token_amount)
             raise err
 
@@ -309,32 +381,6 @@ class KnowledgeAsset(Module):
         )
         result["operation"]["mintKnowledgeAsset"] = json.loads(Web3.to_json(receipt))
 
-        assertions_list = [
-            {
-                "blockchain": blockchain_id,
-                "contract": content_asset_storage_address,
-                "tokenId": token_id,
-                "assertionId": public_assertion_id,
-                "assertion": assertions["public"],
-                "storeType": StoreTypes.TRIPLE,
-            }
-        ]
-
-        if content.get("private", None):
-            assertions_list.append(
-                {
-                    "blockchain": blockchain_id,
-                    "contract": content_asset_storage_address,
-                    "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
-                    "assertion": assertions["private"],
-                    "storeType": StoreTypes.TRIPLE,
-                }
-            )
-
         operation_id = self._publish(
             public_assertion_id,
             assertions["public"],
@@ -343,7 +389,25 @@ class KnowledgeAsset(Module):
             token_id,
             DEFAULT_HASH_FUNCTION_ID,
         )["operationId"]
-        operation_result = self.get_operation_result(operation_id, "publish")
+
+        # Poll the publish operation in the background, overlapping the node's
+        # processing with the local-store payload construction (which includes
+        # the private assertion Merkle root).
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            publish_result_future = executor.submit(
+                self.get_operation_result, operation_id, "publish"
+            )
+
+            assertions_list = self._build_assertions_list(
+                blockchain_id,
+                content_asset_storage_address,
+                token_id,
+                public_assertion_id,
+                assertions,
+                StoreTypes.TRIPLE,
+            )
+
+            operation_result = publish_result_future.result()
 
         result["operation"]["publish"] = {
             "operationId": operation_id,
@@ -441,25 +505,26 @@ class KnowledgeAsset(Module):
 
         assertions = format_content(content, content_type)
 
+        public_assertion_leaves, public_assertion_metadata = (
+            hash_and_measure_assertion(assertions["public"])
+        )
         public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
+            public_assertion_leaves,
             sort_pairs=True,
         ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
+            agreement_id, timestamp_now = self._get_agreement_id_and_timestamp(
                 content_asset_storage_address, token_id
             )
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData] = (
+                self._get_cached_service_agreement_data(agreement_id)
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
+            current_epoch = (
+                timestamp_now - agreement_data.startTime
+            ) // agreement_data.epochLength
             epochs_left = agreement_data.epochsNumber - current_epoch
 
             token_amount = int(
@@ -475,7 +540,7 @@ class KnowledgeAsset(Module):
             )
 
             token_amount -= agreement_data.tokens[0]
-            token_amount = token_amount if token_amount > 0 else 0
+            token_amount = max(token_amount, 0)
 
         current_allowance = self.get_current_allowance()
         if is_allowance_increased := current_allowance < token_amount:
@@ -495,31 +560,21 @@ class KnowledgeAsset(Module):
                 self.decrease_allowance(token_amount)
             raise err
 
-        assertions_list = [
-            {
-                "blockchain": blockchain_id,
-                "contract": content_asset_storage_address,
-                "tokenId": token_id,
-                "assertionId": public_assertion_id,
-                "assertion": assertions["public"],
-                "storeType": StoreTypes.PENDING,
-            }
-        ]
+        # The state update changes the agreement's token amounts and mines a
+        # new block, so the cached reads are stale for this asset.
+        self._invalidate_agreement_data_cache(content_asset_storage_address, token_id)
+        self._block_timestamp_cache = None
+        for cache_key in [k for k in self._get_result_cache if k[0] == ual]:
+            del self._get_result_cache[cache_key]
 
-        if content.get("private", None):
-            assertions_list.append(
-                {
-                    "blockchain": blockchain_id,
-                    "contract": content_asset_storage_address,
-                    "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
-                    "assertion": assertions["private"],
-                    "storeType": StoreTypes.PENDING,
-                }
-            )
+        assertions_list = self._build_assertions_list(
+            blockchain_id,
+            content_asset_storage_address,
+            token_id,
+            public_assertion_id,
+            assertions,
+            StoreTypes.PENDING,
+        )
 
         operation_id = self._local_store(assertions_list)["operationId"]
         self.get_operation_result(operation_id, "local-store")
@@ -645,6 +700,23 @@ class KnowledgeAsset(Module):
             case _:
                 raise InvalidStateOption(f"Invalid state option: {state}.")
 
+        # Repeated gets for an unchanged state are answered from the result
+        # cache; the resolved assertion id in the key makes entries for
+        # updated assets miss naturally.
+        cache_key = (
+            ual,
+            public_assertion_id,
+            content_visibility,
+            output_format,
+            validate,
+        )
+        cached_result = self._get_result_cache.get(cache_key, None)
+        if cached_result is not None:
+            self._get_result_cache.move_to_end(cache_key)
+            # Hand out a copy so callers mutating the returned structure
+            # can't corrupt the cached snapshot.
+            return copy.deepcopy(cached_result)
+
         get_public_operation_id: NodeResponseDict = self._get(
             ual, public_assertion_id, hashFunctionId=1
         )["operationId"]
@@ -672,9 +744,8 @@ class KnowledgeAsset(Module):
 
             match output_format:
                 case "NQUADS" | "N-QUADS":
-                    formatted_public_assertion: list[JSONLD] = jsonld.from_rdf(
-                        "\n".join(public_assertion),
-                        {"algorithm": "URDNA2015", "format": "application/n-quads"},
+                    formatted_public_assertion: list[JSONLD] = from_rdf_nquads(
+                        public_assertion
                     )
                 case "JSONLD" | "JSON-LD":
                     formatted_public_assertion = "\n".join(public_assertion)
@@ -762,12 +833,8 @@ class KnowledgeAsset(Module):
 
                     match output_format:
                         case "NQUADS" | "N-QUADS":
-                            formatted_private_assertion: list[JSONLD] = jsonld.from_rdf(
-                                "\n".join(private_assertion),
-                                {
-                                    "algorithm": "URDNA2015",
-                                    "format": "application/n-quads",
-                                },
+                            formatted_private_assertion: list[JSONLD] = from_rdf_nquads(
+                                private_assertion
                             )
                         case "JSONLD" | "JSON-LD":
                             formatted_private_assertion = "\n".join(private_assertion)
@@ -795,6 +862,10 @@ class KnowledgeAsset(Module):
                             "status": query_private_operation_result["status"],
                         }
 
+        self._get_result_cache[cache_key] = copy.deepcopy(result)
+        if len(self._get_result_cache) > self.GET_RESULT_CACHE_MAX_ENTRIES:
+            self._get_result_cache.popitem(last=False)
+
         return result
 
     _extend_storing_period = Method(BlockchainRequest.extend_asset_storing_period)
@@ -834,6 +905,8 @@ class KnowledgeAsset(Module):
             token_id, additional_epochs, token_amount
         )
 
+        self._invalidate_agreement_data_cache(content_asset_storage_address, token_id)
+
         return {
             "UAL": ual,
             "operation": json.loads(Web3.to_json(receipt)),
@@ -859,14 +932,14 @@ class KnowledgeAsset(Module):
                 content_asset_storage_address, token_id
             )
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData] = (
+                self._get_cached_service_agreement_data(agreement_id)
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
+            timestamp_now = self._get_latest_block_timestamp()
+            current_epoch = (
+                timestamp_now - agreement_data.startTime
+            ) // agreement_data.epochLength
             epochs_left = agreement_data.epochsNumber - current_epoch
 
             latest_finalized_state = self._get_latest_assertion_id(token_id)
@@ -895,6 +968,8 @@ class KnowledgeAsset(Module):
 
         receipt: TxReceipt = self._add_tokens(token_id, token_amount)
 
+        self._invalidate_agreement_data_cache(content_asset_storage_address, token_id)
+
         return {
             "UAL": ual,
             "operation": json.loads(Web3.to_json(receipt)),
@@ -919,14 +994,14 @@ class KnowledgeAsset(Module):
                 content_asset_storage_address, token_id
             )
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData] = (
+                self._get_cached_service_agreement_data(agreement_id)
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
+            timestamp_now = self._get_latest_block_timestamp()
+            current_epoch = (
+                timestamp_now - agreement_data.startTime
+            ) // agreement_data.epochLength
             epochs_left = agreement_data.epochsNumber - current_epoch
 
             unfinalized_state = self._get_latest_assertion_id(token_id)
@@ -953,6 +1028,8 @@ class KnowledgeAsset(Module):
 
         receipt: TxReceipt = self._add_update_tokens(token_id, token_amount)
 
+        self._invalidate_agreement_data_cache(content_asset_storage_address, token_id)
+
         return {
             "UAL": ual,
             "operation": json.loads(Web3.to_json(receipt)),
@@ -966,19 +1043,154 @@ class KnowledgeAsset(Module):
     _get_assertion_id_by_index = Method(BlockchainRequest.get_assertion_id_by_index)
 
     def get_agreement_id(self, contract_address: Address, token_id: int) -> HexStr:
-        first_assertion_id = self._get_assertion_id_by_index(token_id, 0)
+        cache_key = (contract_address, token_id)
+
+        # The agreement id is deterministic from the first assertion id, which
+        # is immutable once the asset is created, so it is safe to memoize.
+        if cache_key not in self._agreement_id_cache:
+            first_assertion_id = self._get_assertion_id_by_index(token_id, 0)
+            keyword = generate_keyword(contract_address, first_assertion_id)
+            self._agreement_id_cache[cache_key] = generate_agreement_id(
+                contract_address, token_id, keyword
+            )
+
+        return self._agreement_id_cache[cache_key]
+
+    def _get_agreement_id_and_timestamp(
+        self, contract_address: Address, token_id: int
+    ) -> tuple[bytes, int]:
+        cache_key = (contract_address, token_id)
+
+        if cache_key in self._agreement_id_cache:
+            return (
+                self._agreement_id_cache[cache_key],
+                self._get_latest_block_timestamp(),
+            )
+
+        batched = self._batch_first_assertion_id_and_timestamp(token_id)
+        if batched is None:
+            return (
+                self.get_agreement_id(contract_address, token_id),
+                self._get_latest_block_timestamp(),
+            )
+
+        first_assertion_id, timestamp = batched
         keyword = generate_keyword(contract_address, first_assertion_id)
-        return generate_agreement_id(contract_address, token_id, keyword)
+        self._agreement_id_cache[cache_key] = generate_agreement_id(
+            contract_address, token_id, keyword
+        )
+
+        return self._agreement_id_cache[cache_key], timestamp
+
+    def _batch_first_assertion_id_and_timestamp(
+        self, token_id: int
+    ) -> tuple[bytes, int] | None:
+        provider = self.manager.blockchain_provider
+
+        try:
+            first_assertion_id, timestamp = provider.multicall(
+                [
+                    (
+                        "ContentAssetStorage",
+                        "getAssertionIdByIndex",
+                        {"tokenId": token_id, "index": 0},
+                    ),
+                    ("Multicall3", "getCurrentBlockTimestamp", {}),
+                ]
+            )
+            return first_assertion_id, timestamp
+        except Exception:
+            # Multicall3 isn't deployed on every chain.
+            pass
+
+        # HTTP JSON-RPC batch: both reads in one POST, for chains without
+        # Multicall3. Nodes that reject batch payloads fall through to the
+        # serial calls.
+        try:
+            contract = provider.contracts["ContentAssetStorage"]
+            assertion_id_hex, latest_block = provider.batch_json_rpc(
+                [
+                    (
+                        "eth_call",
+                        [
+                            {
+                                "to": contract.address,
+                                "data": contract.encodeABI(
+                                    fn_name="getAssertionIdByIndex",
+                                    kwargs={"tokenId": token_id, "index": 0},
+                                ),
+                            },
+                            "latest",
+                        ],
+                    ),
+                    ("eth_getBlockByNumber", ["latest", False]),
+                ]
+            )
+            return (
+                Web3.to_bytes(hexstr=assertion_id_hex),
+                int(latest_block["timestamp"], 16),
+            )
+        except Exception:
+            pass
+
+        return None
+
+    def _invalidate_agreement_data_cache(
+        self, content_asset_storage_address: Address, token_id: int
+    ) -> None:
+        # Any transaction touching the service agreement (state update,
+        # storing period extension, token top-up) invalidates the cached
+        # agreement data for that asset.
+        self._agreement_data_cache.pop(
+            self._agreement_id_cache.get(
+                (content_asset_storage_address, token_id), None
+            ),
+            None,
+        )
+
+    def _get_cached_service_agreement_data(
+        self, agreement_id: bytes
+    ) -> Type[AgreementData]:
+        cached = self._agreement_data_cache.get(agreement_id, None)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        agreement_data: Type[AgreementData] = self._get_service_agreement_data(
+            agreement_id
+        )
+        self._agreement_data_cache[agreement_id] = (
+            agreement_data,
+            time.monotonic() + agreement_data.epochLength / 10,
+        )
+
+        return agreement_data
+
+    def _get_latest_block_timestamp(self) -> int:
+        cached = self._block_timestamp_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        timestamp = self._get_block("latest")["timestamp"]
+        self._block_timestamp_cache = (
+            timestamp,
+            time.monotonic() + self.BLOCK_TIMESTAMP_CACHE_TTL,
+        )
+
+        return timestamp
 
     _get_operation_result = Method(NodeRequest.get_operation_result)
+    _get_operation_result_long_poll = Method(
+        NodeRequest.get_operation_result_long_poll
+    )
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
+    @poll(catch=OperationNotFinished, deadline=OPERATION_RESULT_DEADLINE)
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
-        operation_result = self._get_operation_result(
+        operation_result = self._get_operation_result_long_poll(
             operation_id=operation_id,
             operation=operation,
+            wait_ms=self.OPERATION_RESULT_LONG_POLL_WAIT_MS,
         )
 
         validate_operation_status(operation_result)
@@ -86,6 +86,9 @@ DEFAULT_GAS_PRICE_GWEI = {
     "base": 20,
 }
 
+# Canonical Multicall3 deployment, shared across most EVM chains.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 DEFAULT_HASH_FUNCTION_ID = 1
 DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS = {
     "development": {
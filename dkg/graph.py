@@ -23,7 +23,7 @@ from dkg.manager import DefaultRequestManager
 from dkg.method import Method
 from dkg.module import Module
 from dkg.types import NQuads
-from dkg.utils.decorators import retry
+from dkg.utils.decorators import poll
 from dkg.utils.node_request import NodeRequest, validate_operation_status
 
 
@@ -49,7 +49,7 @@ class Graph(Module):
 
         return operation_result["data"]
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
+    @poll(catch=OperationNotFinished, deadline=60)
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
@@ -36,6 +36,10 @@ if TYPE_CHECKING:
 class Method(Generic[TFunc]):
     def __init__(self, action: JSONRPCRequest | ContractInteraction | NodeCall):
         self.action = action
+        self.name: str | None = None
+
+    def __set_name__(self, _: Type["Module"], name: str):
+        self.name = name
 
     def __get__(
         self, obj: "Module | None" = None, _: Type["Module"] | None = None
@@ -46,7 +50,16 @@ class Method(Generic[TFunc]):
                 "Methods must be called from a module instance, "
                 "usually attached to a dkg instance."
             )
-        return obj.retrieve_caller_fn(self)
+
+        caller = obj.retrieve_caller_fn(self)
+
+        if self.name is not None:
+            # Method is a non-data descriptor, so storing the resolved caller
+            # under the same name on the instance shadows the descriptor and
+            # skips re-resolution on every subsequent access.
+            setattr(obj, self.name, caller)
+
+        return caller
 
     def process_args(self, *args: Any, **kwargs: Any):
         match self.action:
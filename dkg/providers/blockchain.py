@@ -23,7 +23,7 @@ from pathlib import Path
 from typing import Any, Type
 
 import requests
-from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI
+from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI, MULTICALL3_ADDRESS
 from dkg.exceptions import (
     AccountMissing,
     EnvironmentNotSupported,
@@ -33,12 +33,49 @@ from dkg.exceptions import (
 from dkg.types import URI, Address, DataHexStr, Environment, Wei
 from eth_account.signers.local import LocalAccount
 from web3 import Web3
+from web3._utils.abi import get_abi_output_types
 from web3.contract import Contract
 from web3.contract.contract import ContractFunction
 from web3.logs import DISCARD
 from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.types import ABI, ABIFunction, TxReceipt
 
+MULTICALL3_ABI: ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    },
+    {
+        "type": "function",
+        "name": "getCurrentBlockTimestamp",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "timestamp", "type": "uint256"}],
+    },
+]
+
 
 class BlockchainProvider:
     CONTRACTS_METADATA_DIR = Path(__file__).parents[1] / "data/interfaces"
@@ -51,6 +88,7 @@ class BlockchainProvider:
         private_key: DataHexStr | None = None,
         gas_price: Wei | None = None,
         verify: bool = True,
+        pipeline_transactions: bool = False,
     ):
         if environment not in BLOCKCHAINS.keys():
             raise EnvironmentNotSupported(f"Environment {environment} isn't supported!")
@@ -87,6 +125,10 @@ class BlockchainProvider:
                 )
 
         self.gas_price = gas_price
+        # Opt-in: allows dependent transactions to be submitted back-to-back
+        # against the pending nonce instead of waiting for each receipt. Some
+        # RPC providers reject or reorder such bundles, hence off by default.
+        self.pipeline_transactions = pipeline_transactions
         self.gas_price_oracle = BLOCKCHAINS[self.environment][self.blockchain_id].get(
             "gas_price_oracle",
             None,
@@ -103,6 +145,7 @@ class BlockchainProvider:
                 decode_tuples=True,
             )
         }
+        self._contract_address_cache: dict[str, Address] = {}
         self._init_contracts()
 
         if (
@@ -150,6 +193,7 @@ class BlockchainProvider:
         state_changing: bool = False,
         gas_price: Wei | None = None,
         gas_limit: Wei | None = None,
+        wait_for_receipt: bool = True,
     ) -> TxReceipt | Any:
         if isinstance(contract, str):
             contract_name = contract
@@ -189,10 +233,92 @@ class BlockchainProvider:
             }
 
             tx_hash = contract_function(**args).transact(options)
+
+            if not wait_for_receipt:
+                return tx_hash
+
             tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
 
             return tx_receipt
 
+    def get_contract_address(self, contract_name: str) -> Address:
+        # Contract addresses are invariant per connection; instantiated
+        # contracts already carry theirs, the rest are resolved through the
+        # Hub once and memoized instead of issuing an eth_call per lookup.
+        if contract_name in self.contracts:
+            return self.contracts[contract_name].address
+
+        if contract_name not in self._contract_address_cache:
+            self._contract_address_cache[contract_name] = (
+                self.contracts["Hub"]
+                .functions.getContractAddress(contract_name)
+                .call()
+            )
+
+        return self._contract_address_cache[contract_name]
+
+    def batch_json_rpc(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        # Single HTTP round trip for several JSON-RPC reads: the payload is a
+        # JSON array of requests, which every spec-compliant node answers
+        # with an array of responses (matched by id, order not guaranteed).
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+
+        response = requests.post(
+            self.rpc_uri,
+            json=payload,
+            **self.w3.provider.get_request_kwargs(),
+        )
+        response.raise_for_status()
+        responses = {item["id"]: item for item in response.json()}
+
+        results = []
+        for i in range(len(calls)):
+            item = responses[i]
+            if "error" in item:
+                raise ValueError(item["error"])
+            results.append(item["result"])
+
+        return results
+
+    def multicall(self, calls: list[tuple[str, str, dict[str, Any]]]) -> list[Any]:
+        multicall_contract = self.w3.eth.contract(
+            address=MULTICALL3_ADDRESS,
+            abi=MULTICALL3_ABI,
+        )
+
+        aggregated_calls = []
+        output_types = []
+        for contract_name, function, args in calls:
+            contract_instance = (
+                multicall_contract
+                if contract_name == "Multicall3"
+                else self.contracts[contract_name]
+            )
+            aggregated_calls.append(
+                (
+                    contract_instance.address,
+                    False,
+                    contract_instance.encodeABI(fn_name=function, kwargs=args),
+                )
+            )
+            output_types.append(
+                get_abi_output_types(
+                    contract_instance.get_function_by_name(function).abi
+                )
+            )
+
+        responses = multicall_contract.functions.aggregate3(aggregated_calls).call()
+
+        results = []
+        for (_, return_data), types in zip(responses, output_types):
+            decoded = self.w3.codec.decode(types, return_data)
+            results.append(decoded[0] if len(decoded) == 1 else decoded)
+
+        return results
+
     def decode_logs_event(
         self, receipt: TxReceipt, contract_name: str, event_name: str
     ) -> Any:
@@ -271,6 +397,7 @@ class BlockchainProvider:
                 abi=self.abi[contract],
                 decode_tuples=True,
             )
+            self._contract_address_cache.clear()
             return True
         return False
 
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import random
 import time
 from functools import wraps
 from typing import Any, Callable
@@ -22,6 +23,41 @@ from typing import Any, Callable
 from dkg.exceptions import NodeRequestError
 
 
+def poll(
+    catch: Exception,
+    deadline: float,
+    min_interval: float = 0.05,
+    max_interval: float = 2.0,
+) -> Callable[[Callable], Callable]:
+    # Exponential backoff bounded by a wall-clock deadline: quick operations
+    # are picked up within milliseconds, slow ones keep being polled at the
+    # capped interval until the deadline instead of giving up after a fixed
+    # retry count. Sleeps are jittered so parallel clients don't synchronize
+    # their polling against the same node.
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            _deadline = time.monotonic() + deadline
+            _interval = min_interval
+
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except catch:
+                    if time.monotonic() >= _deadline:
+                        raise NodeRequestError(
+                            f"Failed executing {func.__name__} within "
+                            f"{deadline}s."
+                        )
+
+                    time.sleep(random.uniform(0.8, 1.2) * _interval)
+                    _interval = min(_interval * 2, max_interval)
+
+        return wrapper
+
+    return decorator
+
+
 def retry(
     catch: Exception, max_retries: int, base_delay: int, backoff: float
 ) -> Callable[[Callable], Callable]:
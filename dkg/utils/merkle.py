@@ -22,6 +22,7 @@ from typing import Callable
 from dkg.exceptions import LeafNotInTree
 from dkg.types import HexStr
 from eth_abi.packed import encode_packed
+from eth_hash.auto import keccak
 from hexbytes import HexBytes
 from web3 import Web3
 
@@ -35,6 +36,28 @@ def solidity_keccak256(data: HexStr) -> HexStr:
     return bytes_hash.hex()
 
 
+_index_suffixes: list[bytes] = []
+
+
+def _index_suffix(index: int) -> bytes:
+    # The uint256 big-endian encodings of small indexes recur across every
+    # assertion, so they are encoded once and reused rather than rebuilt
+    # per leaf.
+    try:
+        return _index_suffixes[index]
+    except IndexError:
+        for i in range(len(_index_suffixes), index + 1):
+            _index_suffixes.append(i.to_bytes(32, "big"))
+        return _index_suffixes[index]
+
+
+def hash_leaf_with_index(leaf: str, index: int) -> HexStr:
+    # keccak256(abi.encodePacked(keccak256(leaf), uint256(index))) computed
+    # directly on bytes, skipping the per-leaf ABI packing and HexBytes
+    # wrapping of the Web3 helpers.
+    return "0x" + keccak(keccak(leaf.encode("utf-8")) + _index_suffix(index)).hex()
+
+
 def hash_assertion_with_indexes(
     leaves: list[str],
     hash_function: str | Callable[[str], HexStr] = solidity_keccak256,
@@ -43,6 +66,9 @@ def hash_assertion_with_indexes(
     if sort:
         leaves.sort()
 
+    if hash_function is solidity_keccak256:
+        return [hash_leaf_with_index(leaf, i) for i, leaf in enumerate(leaves)]
+
     return list(
         map(
             hash_function,
@@ -76,6 +102,11 @@ class MerkleTree:
         return self.tree[0][0]
 
     def build_tree(self) -> list[list[HexStr]]:
+        if self.hash_function is solidity_keccak256:
+            tree = self._build_tree_keccak_bytes()
+            if tree is not None:
+                return tree
+
         tree = [self.leaves]
 
         while len(level := tree[-1]) > 1:
@@ -97,6 +128,41 @@ class MerkleTree:
         tree.reverse()
         return tree
 
+    def _build_tree_keccak_bytes(self) -> list[list[HexStr]] | None:
+        level = []
+        try:
+            for leaf in self.leaves:
+                if leaf[:2] != "0x" or leaf != leaf.lower():
+                    return None
+                level.append(bytes.fromhex(leaf[2:]))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        tree = [self.leaves]
+
+        # One 64-byte scratch buffer serves every pair hash, instead of
+        # allocating a fresh concatenation per node.
+        scratch = bytearray(64)
+
+        while len(level) > 1:
+            next_level = []
+            for i in range(0, len(level) - 1, 2):
+                h1, h2 = level[i], level[i + 1]
+                if self.sort_pairs and h2 < h1:
+                    h1, h2 = h2, h1
+                scratch[0:32] = h1
+                scratch[32:64] = h2
+                next_level.append(keccak(scratch))
+
+            if len(level) % 2:
+                next_level.append(level[-1])
+
+            level = next_level
+            tree.append(["0x" + node.hex() for node in level])
+
+        tree.reverse()
+        return tree
+
     def proof(self, leaf: HexStr, index: int | None = None) -> list[HexStr]:
         if index is None:
             for i, t_leaf in enumerate(self.leaves):
@@ -18,7 +18,8 @@
 import hashlib
 import json
 
-from dkg.types import Address, NQuads
+from dkg.types import Address, HexStr, NQuads
+from dkg.utils.merkle import hash_leaf_with_index
 from eth_abi.packed import encode_packed
 
 
@@ -30,6 +31,29 @@ def generate_assertion_metadata(assertion: NQuads) -> dict[str, int]:
     }
 
 
+def hash_and_measure_assertion(
+    assertion: NQuads,
+) -> tuple[list[HexStr], dict[str, int]]:
+    # Fused variant of hash_assertion_with_indexes + generate_assertion_metadata:
+    # one walk over the (potentially MB-sized) N-Quads produces both the Merkle
+    # leaves and the assertion metadata, instead of two separate passes.
+    assertion.sort()
+
+    leaves = []
+    size = 2  # the enclosing "[]" of the serialized JSON array
+    for index, quad in enumerate(assertion):
+        if index:
+            size += 1  # the "," separator
+        size += len(json.dumps(quad).encode("utf-8"))
+        leaves.append(hash_leaf_with_index(quad, index))
+
+    return leaves, {
+        "size": size,
+        "triples_number": len(assertion),
+        "chunks_number": len(assertion),  # TODO: Change when chunking introduced
+    }
+
+
 def generate_keyword(contract_address: Address, assertion_id: bytes) -> bytes:
     return encode_packed(
         ["address", "bytes32"],
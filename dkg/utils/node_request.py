@@ -51,6 +51,14 @@ class NodeRequest:
         method=HTTPRequestMethod.GET,
         path="{operation}/{operation_id}",
     )
+    # Same endpoint, but asks the node to hold the response until the
+    # operation completes or waitMs elapses. Nodes that don't support
+    # long-polling ignore the parameter and respond immediately.
+    get_operation_result_long_poll = NodeCall(
+        method=HTTPRequestMethod.GET,
+        path="{operation}/{operation_id}",
+        params={"waitMs": int},
+    )
 
     local_store = NodeCall(
         method=HTTPRequestMethod.POST,
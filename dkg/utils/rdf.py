@@ -15,13 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 from dkg.constants import PRIVATE_ASSERTION_PREDICATE
 from dkg.exceptions import DatasetInputFormatNotSupported, InvalidDataset
 from dkg.types import JSONLD, HexStr, NQuads
+from dkg.utils import rdf_native
 from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
-from pyld import jsonld
 
 
 def normalize_dataset(
@@ -44,7 +45,7 @@ def normalize_dataset(
                 "Supported formats: JSON-LD / N-Quads."
             )
 
-    n_quads = jsonld.normalize(dataset, normalization_options)
+    n_quads = rdf_native.normalize(dataset, normalization_options)
     assertion = [quad for quad in n_quads.split("\n") if quad]
 
     if not assertion:
@@ -53,17 +54,46 @@ def normalize_dataset(
     return assertion
 
 
+def _is_anonymous_graph_document(document: JSONLD) -> bool:
+    # A top-level @graph without @id is a free-floating graph: inside the
+    # baseline @graph wrapper it canonicalizes into a blank named graph,
+    # while on its own it collapses into the default graph, changing the
+    # quads and therefore the assertion id.
+    return (
+        isinstance(document, dict) and "@graph" in document and "@id" not in document
+    )
+
+
 def format_content(
     content: dict[Literal["public", "private"], JSONLD],
     type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
 ) -> dict[str, dict[str, HexStr | NQuads | int]]:
+    public = content.get("public", None)
+    private = content.get("private", None)
+
+    if public and not private and not _is_anonymous_graph_document(public):
+        # Common public-only case: the @graph wrapper exists solely to inject
+        # the private assertion triple, so canonicalize the content directly.
+        return {
+            "public": normalize_dataset(public, type),
+            "private": {},
+        }
+
     public_graph = {"@graph": []}
 
-    if content.get("public", None):
-        public_graph["@graph"].append(content["public"])
+    if private:
+        # The public graph can't be canonicalized before the private root is
+        # injected, so only the private canonicalization runs on a worker
+        # thread; the public document is appended as-is, exactly like the
+        # public-only branch below.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            private_future = executor.submit(normalize_dataset, private, type)
+
+            if public:
+                public_graph["@graph"].append(public)
+
+            private_assertion = private_future.result()
 
-    if content.get("private", None):
-        private_assertion = normalize_dataset(content["private"], type)
         private_assertion_id = MerkleTree(
             hash_assertion_with_indexes(private_assertion),
             sort_pairs=True,
@@ -72,12 +102,12 @@ def format_content(
         public_graph["@graph"].append(
             {PRIVATE_ASSERTION_PREDICATE: private_assertion_id}
         )
+    elif public:
+        public_graph["@graph"].append(public)
 
     public_assertion = normalize_dataset(public_graph, type)
 
     return {
         "public": public_assertion,
-        "private": private_assertion
-        if content.get("private", None)
-        else {},
+        "private": private_assertion if private else {},
     }
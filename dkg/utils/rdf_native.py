@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+
+from dkg.types import JSONLD, NQuads
+from pyld import jsonld
+
+try:
+    import json_ld_rs as _json_ld_rs
+except ImportError:
+    _json_ld_rs = None
+
+NQUADS_OPTIONS = {
+    "algorithm": "URDNA2015",
+    "format": "application/n-quads",
+}
+
+_document_cache: dict[str, Any] = {}
+
+
+def _install_caching_document_loader() -> None:
+    base_loader = jsonld.get_document_loader()
+
+    def caching_loader(url: str, options: dict[str, Any] = {}) -> Any:
+        if url not in _document_cache:
+            _document_cache[url] = base_loader(url, options)
+        return _document_cache[url]
+
+    jsonld.set_document_loader(caching_loader)
+
+
+_install_caching_document_loader()
+
+
+def from_rdf_nquads(nquads: str | NQuads) -> list[JSONLD]:
+    # Callers pass the quad list as-is; a single buffer is only materialized
+    # here, for backends that can't consume an iterable of lines.
+    if _json_ld_rs is not None:
+        try:
+            return _json_ld_rs.from_rdf(nquads, dict(NQUADS_OPTIONS))
+        except Exception:
+            pass
+
+    document = nquads if isinstance(nquads, str) else "\n".join(nquads)
+
+    return jsonld.from_rdf(document, dict(NQUADS_OPTIONS))
+
+
+def expand(dataset: JSONLD) -> list[JSONLD]:
+    if _json_ld_rs is not None:
+        try:
+            return _json_ld_rs.expand(dataset)
+        except Exception:
+            pass
+
+    return jsonld.expand(dataset)
+
+
+def normalize(dataset: JSONLD | str, options: dict[str, Any]) -> str:
+    if _json_ld_rs is not None:
+        try:
+            return _json_ld_rs.normalize(dataset, dict(options))
+        except Exception:
+            pass
+
+    return jsonld.normalize(dataset, options)